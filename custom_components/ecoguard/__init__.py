@@ -1,5 +1,8 @@
 import logging
+from bisect import bisect_right
 from datetime import UTC, datetime
+from itertools import accumulate
+from operator import itemgetter
 
 from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
 from homeassistant.components.recorder.models.statistics import StatisticMeanType
@@ -44,25 +47,25 @@ def _build_energy_statistics(
     entries: list[tuple[datetime, float]],
     start_sum: float = 0.0,
 ) -> list[StatisticData]:
-    accumulated = start_sum
-    statistics: list[StatisticData] = []
-    for dt, kwh in entries:
-        accumulated += kwh
-        statistics.append(StatisticData(start=dt, state=kwh, sum=accumulated))
-    return statistics
+    sums = accumulate((kwh for _, kwh in entries), initial=start_sum)
+    next(sums)  # drop the seed value
+    return [
+        StatisticData(start=dt, state=kwh, sum=total)
+        for (dt, kwh), total in zip(entries, sums)
+    ]
 
 
 def _build_cost_statistics(
     entries: list[tuple[datetime, float, float]],
     start_sum: float = 0.0,
 ) -> list[StatisticData]:
-    accumulated = start_sum
-    statistics: list[StatisticData] = []
-    for dt, kwh, rate in entries:
-        cost = kwh * rate
-        accumulated += cost
-        statistics.append(StatisticData(start=dt, state=cost, sum=accumulated))
-    return statistics
+    costs = [kwh * rate for _, kwh, rate in entries]
+    sums = accumulate(costs, initial=start_sum)
+    next(sums)  # drop the seed value
+    return [
+        StatisticData(start=dt, state=cost, sum=total)
+        for (dt, _, _), cost, total in zip(entries, costs, sums)
+    ]
 
 
 def _get_last_stat(
@@ -87,27 +90,50 @@ async def _async_import_statistics(
             return
 
         recorder = get_recorder(hass)
-        last_energy_start, last_energy_sum = await recorder.async_add_executor_job(
-            _get_last_stat, hass, f"{DOMAIN}:energy_consumption"
-        )
+        last_energy_start = coordinator._last_energy_start
+        last_energy_sum = coordinator._last_energy_sum
+        if last_energy_start is None:
+            last_energy_start, last_energy_sum = await recorder.async_add_executor_job(
+                _get_last_stat, hass, f"{DOMAIN}:energy_consumption"
+            )
         if last_energy_start is not None:
-            energy_entries = [(dt, kwh) for dt, kwh in energy_entries if dt > last_energy_start]
+            # historical_entries is sorted by start time.
+            idx = bisect_right(energy_entries, last_energy_start, key=itemgetter(0))
+            energy_entries = energy_entries[idx:]
 
         if energy_entries:
-            energy_stats = _build_energy_statistics(energy_entries, start_sum=last_energy_sum)
+            # Building thousands of StatisticData rows is CPU work; keep it
+            # off the event loop.
+            energy_stats = await recorder.async_add_executor_job(
+                _build_energy_statistics, energy_entries, last_energy_sum
+            )
             async_add_external_statistics(hass, ENERGY_METADATA, energy_stats)
+            coordinator._last_energy_start = energy_entries[-1][0]
+            coordinator._last_energy_sum = last_energy_sum + sum(
+                kwh for _, kwh in energy_entries
+            )
 
         cost_entries = coordinator.historical_cost_entries
         if cost_entries:
-            last_cost_start, last_cost_sum = await recorder.async_add_executor_job(
-                _get_last_stat, hass, f"{DOMAIN}:energy_cost"
-            )
+            last_cost_start = coordinator._last_cost_start
+            last_cost_sum = coordinator._last_cost_sum
+            if last_cost_start is None:
+                last_cost_start, last_cost_sum = await recorder.async_add_executor_job(
+                    _get_last_stat, hass, f"{DOMAIN}:energy_cost"
+                )
             if last_cost_start is not None:
-                cost_entries = [(dt, kwh, rate) for dt, kwh, rate in cost_entries if dt > last_cost_start]
+                idx = bisect_right(cost_entries, last_cost_start, key=itemgetter(0))
+                cost_entries = cost_entries[idx:]
 
             if cost_entries:
-                cost_stats = _build_cost_statistics(cost_entries, start_sum=last_cost_sum)
+                cost_stats = await recorder.async_add_executor_job(
+                    _build_cost_statistics, cost_entries, last_cost_sum
+                )
                 async_add_external_statistics(hass, COST_METADATA, cost_stats)
+                coordinator._last_cost_start = cost_entries[-1][0]
+                coordinator._last_cost_sum = last_cost_sum + sum(
+                    kwh * rate for _, kwh, rate in cost_entries
+                )
 
         _LOGGER.debug(
             "Imported %d energy and %d cost statistics (incremental)",
@@ -120,17 +146,18 @@ async def _async_import_statistics(
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = EcoguardCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await coordinator.async_load_cache()
 
     def _on_update():
         if entry.options.get(CONF_IMPORT_HISTORY, True):
             hass.async_create_task(_async_import_statistics(hass, coordinator))
 
+    # Registered before the first refresh so that refresh triggers the
+    # one and only startup import.
     coordinator.async_add_listener(_on_update)
-    if entry.options.get(CONF_IMPORT_HISTORY, True):
-        await _async_import_statistics(hass, coordinator)
+    await coordinator.async_config_entry_first_refresh()
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
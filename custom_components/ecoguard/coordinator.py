@@ -1,22 +1,74 @@
+import asyncio
 from datetime import datetime, timedelta
+from functools import lru_cache
+from hashlib import blake2b
+from heapq import merge
+from html import unescape
 import logging
+from math import fsum
+from operator import itemgetter
+import re
+import sys
+from typing import NamedTuple
 import unicodedata
 from zoneinfo import ZoneInfo
 
 import aiohttp
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.json import json_loads
 
-from .const import BASE_URL, CONF_DATABASE, CONF_PASSWORD, CONF_USERNAME, LOGIN_URL
+from .const import BASE_URL, CONF_DATABASE, CONF_PASSWORD, CONF_USERNAME, DOMAIN, LOGIN_URL
 
 _LOGGER = logging.getLogger(__name__)
 
 UPDATE_INTERVAL = timedelta(hours=1)
 
+STORAGE_VERSION = 1
+
+_TOKEN_RE = re.compile(rb'name="__RequestVerificationToken"[^>]*value="([^"]+)"')
+
+# Maps decimal commas to points and drops non-breaking spaces in one pass.
+_FLOAT_TRANS = str.maketrans({",": ".", "\xa0": None})
+
+# Interned data keys for the yearly table, indexed by row number; these are
+# the same strings the sensor descriptions look up.
+_MONTH_KEYS = tuple(
+    (
+        sys.intern(f"month_{i}_name"),
+        sys.intern(f"month_{i}_kwh"),
+        sys.intern(f"month_{i}_cost"),
+    )
+    for i in range(14)
+)
+
+
+def _month_keys(i: int) -> tuple[str, str, str]:
+    if i < len(_MONTH_KEYS):
+        return _MONTH_KEYS[i]
+    return (f"month_{i}_name", f"month_{i}_kwh", f"month_{i}_cost")
+
+
+_MONTH_RE = re.compile(
+    r"^(januari|februari|mars|april|maj|juni|juli|augusti"
+    r"|september|oktober|november|december)\s+(\d{4})$",
+    re.IGNORECASE,
+)
+
+# The hourly table rows have a rigid <td>HH:00 - HH:00</td><td>value</td>
+# shape, so one regex pass can skip DOM construction entirely.
+_HOURLY_ROW_RE = re.compile(
+    r"<tr[^>]*>\s*<td[^>]*>\s*(\d{1,2}):00\s*-\s*\d{1,2}:00\s*</td>"
+    r"\s*<td[^>]*>([^<]*)</td>",
+    re.DOTALL,
+)
+
 TZ_STOCKHOLM = ZoneInfo("Europe/Stockholm")
 
 SWEDISH_MONTHS = {
@@ -26,66 +78,153 @@ SWEDISH_MONTHS = {
 }
 
 
+class DailyEntry(NamedTuple):
+    date: str
+    kwh: float | None
+
+
+class EnergyPoint(NamedTuple):
+    dt: datetime
+    kwh: float
+
+
+class CostPoint(NamedTuple):
+    dt: datetime
+    kwh: float
+    rate: float
+
+
+class _SessionExpired(Exception):
+    """Raised when a request gets redirected back to the login page."""
+
+
+# Folds the diacritics that actually occur in Swedish database names; anything
+# else falls back to the full NFKD strip below.
+_DIACRITIC_TRANS = str.maketrans("åäöéèêüÅÄÖÉÈÊÜ", "aaoeeeuAAOEEEU")
+
+
+@lru_cache(maxsize=64)
 def _strip_diacritics(text: str) -> str:
-    nfkd = unicodedata.normalize("NFKD", text)
+    folded = text.translate(_DIACRITIC_TRANS)
+    if folded.isascii():
+        return folded
+    nfkd = unicodedata.normalize("NFKD", folded)
     return "".join(c for c in nfkd if not unicodedata.combining(c))
 
 
+@lru_cache(maxsize=4096)
 def _safe_float(value: str) -> float | None:
-    cleaned = value.replace(",", ".").replace("\xa0", "").strip()
+    if not value or value == "-":
+        return None
+    cleaned = value.translate(_FLOAT_TRANS).strip()
     if not cleaned or cleaned == "-":
         return None
     return float(cleaned)
 
 
+@lru_cache(maxsize=128)
+def _parse_swedish_month(name: str) -> tuple[int, int] | None:
+    """Parse a Swedish 'månad år' label into a (year, month) tuple."""
+    match = _MONTH_RE.match(name.strip())
+    if not match:
+        return None
+    return int(match.group(2)), SWEDISH_MONTHS[match.group(1).lower()]
+
+
+@lru_cache(maxsize=256)
+def _month_start(year: int, month: int) -> datetime:
+    """Return the cached tz-aware first-of-month datetime."""
+    return datetime(year, month, 1, tzinfo=TZ_STOCKHOLM)
+
+
+def _parse_iso_date(value: str) -> datetime | None:
+    """Parse a YYYY-MM-DD string without the strptime overhead."""
+    try:
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]), tzinfo=TZ_STOCKHOLM
+        )
+    except ValueError:
+        return None
+
+
 def _build_domain_path(database: str, username: str) -> str:
     url_database = _strip_diacritics(database)
     return f"/domains/{url_database}/objects/{username}"
 
 
-def _parse_daily_table(html: str) -> list[tuple[str, float]]:
-    soup = BeautifulSoup(html, "html.parser")
-    tbody = soup.find("tbody")
-    if not tbody:
+# Compiled once; per-call row.xpath() would re-parse the expression.
+_XP_TBODY_ROWS = etree.XPath("(//tbody)[1]/tr")
+_XP_ROW_CELLS = etree.XPath("./td")
+
+
+def _table_rows(html: str) -> list[list[str]]:
+    """Return the stripped cell texts for each row of the first tbody."""
+    try:
+        tree = lxml_html.fromstring(html)
+    except etree.ParserError:
+        # An empty response body is not a parse failure worth aborting a
+        # whole refresh over; treat it like a page without a tbody.
         return []
+    return [
+        [td.text_content().strip() for td in _XP_ROW_CELLS(row)]
+        for row in _XP_TBODY_ROWS(tree)
+    ]
+
+
+def _parse_daily_table(html: str) -> list[tuple[str, float]]:
     rows = []
-    for row in tbody.find_all("tr"):
-        cells = row.find_all("td")
+    for cells in _table_rows(html):
         if len(cells) < 2:
             continue
-        date_str = cells[0].get_text(strip=True)
-        kwh = _safe_float(cells[1].get_text(strip=True))
+        # Portal tables pad missing days with "" or "-"; skip those before
+        # paying for the cached float conversion.
+        text = cells[1]
+        if not text or text == "-":
+            continue
+        kwh = _safe_float(text)
         if kwh is not None:
-            rows.append((date_str, kwh))
+            rows.append((cells[0], kwh))
     return rows
 
 
-def _parse_hourly_rolling(html: str, now: datetime) -> list[tuple[datetime, float]]:
-    soup = BeautifulSoup(html, "html.parser")
-    tbody = soup.find("tbody")
-    if not tbody:
-        return []
-
+def _parse_hourly_rolling(html: str, now: datetime) -> list[EnergyPoint]:
     today = now.date()
     yesterday = today - timedelta(days=1)
-    entries: list[tuple[datetime, float]] = []
+    entries: list[EnergyPoint] = []
+
+    rows = _HOURLY_ROW_RE.findall(html)
+    if rows and len(rows) == html.count("<tr"):
+        # The regex captures raw markup text; decode entities like
+        # &nbsp; the way text_content() does on the DOM path.
+        rows = [(hour, unescape(value)) for hour, value in rows]
+    else:
+        # The fast path is only trusted when it accounted for every <tr>;
+        # otherwise fall back to the DOM parser so a partial markup change
+        # cannot silently drop rows.
+        rows = [
+            (cells[0].partition(":")[0], cells[1])
+            for cells in _table_rows(html)
+            if len(cells) >= 2
+        ]
 
-    for row in tbody.find_all("tr"):
-        cells = row.find_all("td")
-        if len(cells) < 2:
+    # Local bindings keep the per-row loop free of global lookups.
+    tz = TZ_STOCKHOLM
+    now_hour = now.hour
+    for hour_str, value in rows:
+        value = value.strip()
+        if not value or value == "-":
             continue
-        time_range = cells[0].get_text(strip=True)
-        kwh = _safe_float(cells[1].get_text(strip=True))
+        kwh = _safe_float(value)
         if kwh is None:
             continue
         try:
-            hour = int(time_range.split(":")[0])
+            hour = int(hour_str)
         except ValueError:
             continue
 
-        day = yesterday if hour >= now.hour else today
-        dt = datetime(day.year, day.month, day.day, hour, tzinfo=TZ_STOCKHOLM)
-        entries.append((dt, kwh))
+        day = yesterday if hour >= now_hour else today
+        dt = datetime(day.year, day.month, day.day, hour, tzinfo=tz)
+        entries.append(EnergyPoint(dt, kwh))
 
     return entries
 
@@ -106,14 +245,15 @@ async def _async_login(
 ) -> None:
     async with session.get(BASE_URL) as resp:
         resp.raise_for_status()
-        html = await resp.text()
+        body = await resp.read()
 
-    soup = BeautifulSoup(html, "html.parser")
-    token_input = soup.find("input", {"name": "__RequestVerificationToken"})
-    if not token_input:
+    # The token appears exactly once; a regex over the raw bytes beats
+    # decoding and parsing the whole login page.
+    match = _TOKEN_RE.search(body)
+    if not match:
         raise UpdateFailed("Could not find antiforgery token on login page")
 
-    token = token_input["value"]
+    token = match.group(1).decode("ascii")
 
     form_data = {
         "RentableObjectNumber": username,
@@ -125,13 +265,13 @@ async def _async_login(
 
     async with session.post(LOGIN_URL, data=form_data, allow_redirects=True) as resp:
         resp.raise_for_status()
-        if "/account/logon" in str(resp.url).lower():
+        if resp.url.path.lower().startswith("/account/logon"):
             raise ConfigEntryAuthFailed("Login failed - check credentials")
 
 
 class EcoguardCoordinator(DataUpdateCoordinator[dict]):
-    historical_entries: list[tuple[datetime, float]]
-    historical_cost_entries: list[tuple[datetime, float, float]]
+    historical_entries: list[EnergyPoint]
+    historical_cost_entries: list[CostPoint]
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         super().__init__(
@@ -140,49 +280,140 @@ class EcoguardCoordinator(DataUpdateCoordinator[dict]):
             name="Ecoguard Insight",
             update_interval=UPDATE_INTERVAL,
         )
+        # Sensors read from this unconditionally; an empty dict before the
+        # first refresh lets them skip a per-read None check.
+        self.data = {}
         self._username = entry.data[CONF_USERNAME]
         self._password = entry.data[CONF_PASSWORD]
         self._database = entry.data[CONF_DATABASE]
         self._domain_path = _build_domain_path(self._database, self._username)
         self._session: aiohttp.ClientSession | None = None
-        self._cached_month_entries: list[tuple[datetime, float]] = []
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}_{entry.entry_id}_history"
+        )
+        self._cached_month_entries: list[EnergyPoint] = []
         self._cached_month_rates: dict[tuple[int, int], float] = {}
         self._cached_months: set[tuple[int, int]] = set()
+        self._yearly_cache: tuple[bytes, dict] | None = None
         self.historical_entries = []
         self.historical_cost_entries = []
+        self._last_energy_start: datetime | None = None
+        self._last_energy_sum = 0.0
+        self._last_cost_start: datetime | None = None
+        self._last_cost_sum = 0.0
+
+    async def async_load_cache(self) -> None:
+        """Restore the historical month caches persisted by a previous run."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        self._cached_month_entries = [
+            EnergyPoint(datetime.fromisoformat(dt), kwh)
+            for dt, kwh in stored.get("month_entries", [])
+        ]
+        self._cached_month_rates = {
+            (year, month): rate for year, month, rate in stored.get("month_rates", [])
+        }
+        self._cached_months = {
+            (year, month) for year, month in stored.get("months", [])
+        }
+
+    async def _async_save_cache(self) -> None:
+        await self._store.async_save(
+            {
+                "month_entries": [
+                    [dt.isoformat(), kwh] for dt, kwh in self._cached_month_entries
+                ],
+                "month_rates": [
+                    [year, month, rate]
+                    for (year, month), rate in self._cached_month_rates.items()
+                ],
+                "months": [[year, month] for year, month in self._cached_months],
+            }
+        )
 
     async def async_shutdown(self) -> None:
         if self._session and not self._session.closed:
             await self._session.close()
         await super().async_shutdown()
 
-    async def _new_session(self) -> aiohttp.ClientSession:
-        if self._session and not self._session.closed:
-            await self._session.close()
-        jar = aiohttp.CookieJar(unsafe=True)
-        self._session = aiohttp.ClientSession(cookie_jar=jar)
-        await _async_login(self._session, self._username, self._password, self._database)
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            jar = aiohttp.CookieJar(unsafe=True)
+            connector = aiohttp.TCPConnector(limit=8, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(cookie_jar=jar, connector=connector)
+            await _async_login(
+                self._session, self._username, self._password, self._database
+            )
         return self._session
 
+    async def _async_relogin(self, session: aiohttp.ClientSession) -> None:
+        session.cookie_jar.clear()
+        try:
+            await _async_login(session, self._username, self._password, self._database)
+        except ConfigEntryAuthFailed:
+            raise
+        except Exception as err:
+            raise UpdateFailed(f"Login failed: {err}") from err
+
+    async def _async_get_html(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> str:
+        async with session.get(url) as resp:
+            # The portal usually redirects expired sessions to the logon
+            # page, but a 401 means the same thing and must trigger the
+            # relogin path rather than surface as a fetch error.
+            if resp.status == 401:
+                raise _SessionExpired
+            resp.raise_for_status()
+            if resp.url.path.lower().startswith("/account/logon"):
+                raise _SessionExpired
+            return await resp.text()
+
     async def _async_update_data(self) -> dict:
         try:
-            session = await self._new_session()
+            session = await self._ensure_session()
         except ConfigEntryAuthFailed:
             raise
         except Exception as err:
             raise UpdateFailed(f"Login failed: {err}") from err
 
+        try:
+            return await self._fetch_all(session)
+        except _SessionExpired:
+            _LOGGER.debug("Session expired, logging in again")
+            await self._async_relogin(session)
+            try:
+                return await self._fetch_all(session)
+            except _SessionExpired as err:
+                # Don't let the private marker escape to the coordinator
+                # base class as an "unexpected" error.
+                raise UpdateFailed("Session expired again after re-login") from err
+
+    async def _fetch_all(self, session: aiohttp.ClientSession) -> dict:
         data: dict = {}
-        for name, fetch in [
+        independent = [
             ("yearly", self._fetch_yearly),
             ("monthly", self._fetch_monthly),
             ("pricelists", self._fetch_pricelists),
-            ("historical", self._fetch_historical),
-        ]:
-            try:
-                await fetch(session, data)
-            except Exception:
-                _LOGGER.exception("Failed to fetch %s data", name)
+        ]
+        results = await asyncio.gather(
+            *(fetch(session, data) for _, fetch in independent),
+            return_exceptions=True,
+        )
+        for (name, _), result in zip(independent, results):
+            if isinstance(result, _SessionExpired):
+                raise result
+            if isinstance(result, BaseException):
+                _LOGGER.error("Failed to fetch %s data", name, exc_info=result)
+
+        # Historical depends on the yearly and pricelist results above.
+        try:
+            await self._fetch_historical(session, data)
+        except _SessionExpired:
+            raise
+        except Exception:
+            _LOGGER.exception("Failed to fetch historical data")
 
         return data
 
@@ -190,57 +421,49 @@ class EcoguardCoordinator(DataUpdateCoordinator[dict]):
         self, session: aiohttp.ClientSession, data: dict
     ) -> None:
         url = f"{BASE_URL}{self._domain_path}/consumption/ViewLatestYearConsumptionTable?UtilityCode=ELEC"
-        async with session.get(url) as resp:
-            resp.raise_for_status()
-            html = await resp.text()
+        html = await self._async_get_html(session, url)
 
-        soup = BeautifulSoup(html, "html.parser")
-        tbody = soup.find("tbody")
-        if not tbody:
+        # The yearly table rarely changes between hourly refreshes; reuse the
+        # previous parse when the payload is byte-identical.
+        digest = blake2b(html.encode(), digest_size=8).digest()
+        if self._yearly_cache is not None and self._yearly_cache[0] == digest:
+            data.update(self._yearly_cache[1])
             return
 
-        rows = tbody.find_all("tr")
-        for i, row in enumerate(rows, start=1):
-            cells = row.find_all("td")
+        parsed: dict = {}
+        rows = _table_rows(html)
+        for i, cells in enumerate(rows, start=1):
             if len(cells) >= 3:
-                name_text = cells[0].get_text(strip=True)
-                kwh_text = cells[1].get_text(strip=True)
-                cost_text = cells[2].get_text(strip=True)
-                data[f"month_{i}_name"] = name_text
-                data[f"month_{i}_kwh"] = _safe_float(kwh_text)
-                data[f"month_{i}_cost"] = _safe_float(cost_text)
+                name_key, kwh_key, cost_key = _month_keys(i)
+                parsed[name_key] = cells[0]
+                parsed[kwh_key] = _safe_float(cells[1])
+                parsed[cost_key] = _safe_float(cells[2])
 
-        data["yearly_month_count"] = len(rows)
+        parsed["yearly_month_count"] = len(rows)
+        self._yearly_cache = (digest, parsed)
+        data.update(parsed)
 
     async def _fetch_monthly(
         self, session: aiohttp.ClientSession, data: dict
     ) -> None:
         url = f"{BASE_URL}{self._domain_path}/consumption/ViewCurrentMonthTable?UtilityCode=ELEC"
-        async with session.get(url) as resp:
-            resp.raise_for_status()
-            html = await resp.text()
-
-        soup = BeautifulSoup(html, "html.parser")
-        tbody = soup.find("tbody")
-        if not tbody:
-            return
-
-        rows = tbody.find_all("tr")
-        total_kwh = 0.0
-        day_count = len(rows)
-
-        daily_entries = []
-        for row in rows:
-            cells = row.find_all("td")
-            if len(cells) >= 2:
-                date_text = cells[0].get_text(strip=True)
-                kwh_val = _safe_float(cells[1].get_text(strip=True))
-                daily_entries.append({"date": date_text, "kwh": kwh_val})
-                if kwh_val is not None:
-                    total_kwh += kwh_val
+        html = await self._async_get_html(session, url)
+
+        rows = _table_rows(html)
+        daily_entries = [
+            DailyEntry(
+                cells[0],
+                None if not cells[1] or cells[1] == "-" else _safe_float(cells[1]),
+            )
+            for cells in rows
+            if len(cells) >= 2
+        ]
+        total_kwh = fsum(
+            entry.kwh for entry in daily_entries if entry.kwh is not None
+        )
 
         data["current_month_total_kwh"] = round(total_kwh, 3)
-        data["current_month_day_count"] = day_count
+        data["current_month_day_count"] = len(rows)
         data["current_month_daily"] = daily_entries
 
     async def _fetch_historical(
@@ -251,66 +474,71 @@ class EcoguardCoordinator(DataUpdateCoordinator[dict]):
         month_count = data.get("yearly_month_count", 0)
         new_months: list[tuple[int, int, int]] = []
         for i in range(1, month_count + 1):
-            name = data.get(f"month_{i}_name")
+            name_key, kwh_key, cost_key = _month_keys(i)
+            name = data.get(name_key)
             if not name:
                 continue
-            parts = name.lower().split()
-            if len(parts) != 2:
-                continue
-            month_num = SWEDISH_MONTHS.get(parts[0])
-            if not month_num:
-                continue
-            try:
-                year = int(parts[1])
-            except ValueError:
+            parsed = _parse_swedish_month(name)
+            if parsed is None:
                 continue
+            year, month_num = parsed
 
-            kwh_total = data.get(f"month_{i}_kwh")
-            cost_total = data.get(f"month_{i}_cost")
+            kwh_total = data.get(kwh_key)
+            cost_total = data.get(cost_key)
             if kwh_total and cost_total:
                 self._cached_month_rates[(year, month_num)] = cost_total / kwh_total
 
             if (year, month_num) not in self._cached_months and (year, month_num) != current_ym:
-                ts = int(datetime(year, month_num, 1, tzinfo=TZ_STOCKHOLM).timestamp())
+                ts = int(_month_start(year, month_num).timestamp())
                 new_months.append((year, month_num, ts))
 
-        for year, month_num, ts in new_months:
-            url = f"{BASE_URL}{self._domain_path}/consumption/ViewMonthTable/{ts}?UtilityCode=ELEC"
-            async with session.get(url) as resp:
-                resp.raise_for_status()
-                html = await resp.text()
-
-            for date_str, kwh in _parse_daily_table(html):
-                try:
-                    dt = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=TZ_STOCKHOLM)
-                except ValueError:
-                    continue
-                self._cached_month_entries.append((dt, kwh))
-
-            self._cached_months.add((year, month_num))
+        if new_months:
+            # Fetch the missing months concurrently (bounded, to stay polite
+            # to the server) and parse them off the event loop.
+            semaphore = asyncio.Semaphore(4)
+
+            async def _fetch_month(ts: int) -> str:
+                url = f"{BASE_URL}{self._domain_path}/consumption/ViewMonthTable/{ts}?UtilityCode=ELEC"
+                async with semaphore:
+                    return await self._async_get_html(session, url)
+
+            htmls = await asyncio.gather(
+                *(_fetch_month(ts) for _, _, ts in new_months)
+            )
+            parsed_months = await asyncio.gather(
+                *(
+                    self.hass.async_add_executor_job(_parse_daily_table, html)
+                    for html in htmls
+                )
+            )
+            for (year, month_num, _), parsed in zip(new_months, parsed_months):
+                for date_str, kwh in parsed:
+                    dt = _parse_iso_date(date_str)
+                    if dt is None:
+                        continue
+                    self._cached_month_entries.append(EnergyPoint(dt, kwh))
+                self._cached_months.add((year, month_num))
+
+            self._cached_month_entries.sort(key=itemgetter(0))
+            await self._async_save_cache()
 
         current_rate = data.get("price_per_kwh", 0.0) or 0.0
         today = now.date()
         yesterday = today - timedelta(days=1)
 
-        current_entries: list[tuple[datetime, float]] = []
+        current_entries: list[EnergyPoint] = []
         for entry in data.get("current_month_daily", []):
-            date_str = entry.get("date")
-            kwh = entry.get("kwh")
-            if not date_str or kwh is None:
+            if not entry.date or entry.kwh is None:
                 continue
-            try:
-                dt = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=TZ_STOCKHOLM)
-            except ValueError:
+            dt = _parse_iso_date(entry.date)
+            if dt is None:
                 continue
             if dt.date() == today:
                 continue
-            current_entries.append((dt, kwh))
+            current_entries.append(EnergyPoint(dt, entry.kwh))
 
         hourly_url = f"{BASE_URL}{self._domain_path}/consumption/ViewLatestDayTable?utilityCode=ELEC"
-        async with session.get(hourly_url) as resp:
-            resp.raise_for_status()
-            hourly_html = await resp.text()
+        hourly_html = await self._async_get_html(session, hourly_url)
 
         hourly_entries = _parse_hourly_rolling(hourly_html, now)
 
@@ -318,20 +546,28 @@ class EcoguardCoordinator(DataUpdateCoordinator[dict]):
             sum(kwh for dt, kwh in hourly_entries if dt.date() == today), 3
         )
 
-        hourly_entries = [(dt, kwh) for dt, kwh in hourly_entries if dt.date() == today]
-
-        all_entries = [
-            (dt, kwh)
-            for dt, kwh in self._cached_month_entries + current_entries + hourly_entries
-            if kwh >= 0
-        ]
-        all_entries.sort(key=lambda x: x[0])
+        hourly_entries = [entry for entry in hourly_entries if entry.dt.date() == today]
+
+        # Each source is sorted, so an O(N) merge replaces the old concat+sort,
+        # and one pass over it builds both the energy and cost histories.
+        current_entries.sort(key=itemgetter(0))
+        hourly_entries.sort(key=itemgetter(0))
+        get_rate = self._cached_month_rates.get
+        all_entries: list[EnergyPoint] = []
+        cost_entries: list[CostPoint] = []
+        for dt, kwh in merge(
+            self._cached_month_entries,
+            current_entries,
+            hourly_entries,
+            key=itemgetter(0),
+        ):
+            if kwh < 0:
+                continue
+            all_entries.append(EnergyPoint(dt, kwh))
+            cost_entries.append(
+                CostPoint(dt, kwh, get_rate((dt.year, dt.month), current_rate))
+            )
         self.historical_entries = all_entries
-
-        cost_entries: list[tuple[datetime, float, float]] = []
-        for dt, kwh in all_entries:
-            rate = self._cached_month_rates.get((dt.year, dt.month), current_rate)
-            cost_entries.append((dt, kwh, rate))
         self.historical_cost_entries = cost_entries
 
     async def _fetch_pricelists(
@@ -340,7 +576,7 @@ class EcoguardCoordinator(DataUpdateCoordinator[dict]):
         url = f"{BASE_URL}{self._domain_path}/pricelists"
         async with session.get(url) as resp:
             resp.raise_for_status()
-            json_data = await resp.json()
+            json_data = await resp.json(loads=json_loads)
 
         pricelists = json_data.get("PriceLists", [])
         if not pricelists:
@@ -1,3 +1,4 @@
+import sys
 from collections.abc import Callable
 from dataclasses import dataclass
 
@@ -33,39 +34,41 @@ class EcoguardSensorDescription(SensorEntityDescription):
     historical: bool = False
 
 
+def _getter(key: str) -> Callable[[dict], float | str | None]:
+    """Return a value_fn that looks up a single precomputed data key."""
+    return lambda data: data.get(key)
+
+
+# (suffix, unit, device class, display precision) per month column.
+_MONTH_TEMPLATES = (
+    ("name", None, None, None),
+    ("kwh", UnitOfEnergy.KILO_WATT_HOUR, SensorDeviceClass.ENERGY, 1),
+    ("cost", "SEK", SensorDeviceClass.MONETARY, 2),
+)
+
+
 def _month_sensors() -> list[EcoguardSensorDescription]:
     sensors: list[EcoguardSensorDescription] = []
     for i in range(1, 13):
-        sensors.extend([
-            EcoguardSensorDescription(
-                key=f"month_{i}_name",
-                translation_key=f"month_{i}_name",
-                historical=True,
-                value_fn=lambda data, idx=i: data.get(f"month_{idx}_name"),
-            ),
-            EcoguardSensorDescription(
-                key=f"month_{i}_kwh",
-                translation_key=f"month_{i}_kwh",
-                native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-                device_class=SensorDeviceClass.ENERGY,
-                suggested_display_precision=1,
-                historical=True,
-                value_fn=lambda data, idx=i: data.get(f"month_{idx}_kwh"),
-            ),
-            EcoguardSensorDescription(
-                key=f"month_{i}_cost",
-                translation_key=f"month_{i}_cost",
-                native_unit_of_measurement="SEK",
-                device_class=SensorDeviceClass.MONETARY,
-                suggested_display_precision=2,
-                historical=True,
-                value_fn=lambda data, idx=i: data.get(f"month_{idx}_cost"),
-            ),
-        ])
+        for suffix, unit, device_class, precision in _MONTH_TEMPLATES:
+            # Interned so the sensor keys share identity with the strings
+            # the coordinator stores in its data dict.
+            key = sys.intern(f"month_{i}_{suffix}")
+            sensors.append(
+                EcoguardSensorDescription(
+                    key=key,
+                    translation_key=key,
+                    native_unit_of_measurement=unit,
+                    device_class=device_class,
+                    suggested_display_precision=precision,
+                    historical=True,
+                    value_fn=_getter(key),
+                )
+            )
     return sensors
 
 
-SENSOR_DESCRIPTIONS: list[EcoguardSensorDescription] = [
+SENSOR_DESCRIPTIONS: tuple[EcoguardSensorDescription, ...] = (
     *_month_sensors(),
     EcoguardSensorDescription(
         key="current_month_total_kwh",
@@ -73,20 +76,20 @@ SENSOR_DESCRIPTIONS: list[EcoguardSensorDescription] = [
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         suggested_display_precision=1,
-        value_fn=lambda data: data.get("current_month_total_kwh"),
+        value_fn=_getter("current_month_total_kwh"),
     ),
     EcoguardSensorDescription(
         key="current_month_day_count",
         translation_key="current_month_day_count",
         native_unit_of_measurement="days",
-        value_fn=lambda data: data.get("current_month_day_count"),
+        value_fn=_getter("current_month_day_count"),
     ),
     EcoguardSensorDescription(
         key="today_kwh",
         translation_key="today_kwh",
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         suggested_display_precision=1,
-        value_fn=lambda data: data.get("today_kwh"),
+        value_fn=_getter("today_kwh"),
     ),
     EcoguardSensorDescription(
         key="price_per_kwh",
@@ -94,14 +97,14 @@ SENSOR_DESCRIPTIONS: list[EcoguardSensorDescription] = [
         native_unit_of_measurement="SEK/kWh",
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=2,
-        value_fn=lambda data: data.get("price_per_kwh"),
+        value_fn=_getter("price_per_kwh"),
     ),
     EcoguardSensorDescription(
         key="price_valid_from",
         translation_key="price_valid_from",
-        value_fn=lambda data: data.get("price_valid_from"),
+        value_fn=_getter("price_valid_from"),
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -110,9 +113,13 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator: EcoguardCoordinator = hass.data[DOMAIN][entry.entry_id]
+    # One shared device-info dict for all sensors of this entry.
+    device_info = _device_info(entry)
     async_add_entities(
-        EcoguardSensor(coordinator, description, entry)
-        for description in SENSOR_DESCRIPTIONS
+        [
+            EcoguardSensor(coordinator, description, entry, device_info)
+            for description in SENSOR_DESCRIPTIONS
+        ]
     )
 
 
@@ -125,22 +132,24 @@ class EcoguardSensor(CoordinatorEntity[EcoguardCoordinator], SensorEntity):
         coordinator: EcoguardCoordinator,
         description: EcoguardSensorDescription,
         entry: ConfigEntry,
+        device_info: dict,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
+        self._value_fn = description.value_fn
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = _device_info(entry)
+        self._attr_device_info = device_info
 
     @property
     def available(self) -> bool:
         if self.coordinator.last_update_success:
             return True
-        if self.entity_description.historical and self.coordinator.data is not None:
-            return self.entity_description.value_fn(self.coordinator.data) is not None
+        if self.entity_description.historical:
+            return self._value_fn(self.coordinator.data) is not None
         return False
 
     @property
     def native_value(self) -> float | str | None:
-        if self.coordinator.data is None:
-            return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        # coordinator.data is always a dict, so missing keys fall out of the
+        # value_fn's dict.get as None without a branch here.
+        return self._value_fn(self.coordinator.data)
@@ -10,7 +10,9 @@ for mod in [
     "homeassistant.components.recorder.statistics",
     "homeassistant.config_entries", "homeassistant.const",
     "homeassistant.core", "homeassistant.exceptions",
-    "homeassistant.helpers", "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers", "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.util", "homeassistant.util.json",
 ]:
     sys.modules.setdefault(mod, ha_mock)
 
@@ -75,6 +77,32 @@ def test_rolling_24h_skips_missing_values():
     assert entries[1][1] == 2.0
 
 
+def test_rolling_24h_decodes_entities():
+    now = datetime(2026, 2, 27, 10, 0, tzinfo=TZ_STOCKHOLM)
+    html = """<table><tbody>
+        <tr><td>10:00 - 11:00</td><td>1&nbsp;234,5</td></tr>
+    </tbody></table>"""
+
+    entries = _parse_hourly_rolling(html, now)
+
+    assert len(entries) == 1
+    assert entries[0][1] == 1234.5
+
+
+def test_rolling_24h_falls_back_on_partially_matching_markup():
+    now = datetime(2026, 2, 27, 10, 0, tzinfo=TZ_STOCKHOLM)
+    html = """<table><tbody>
+        <tr><td>10:00 - 11:00</td><td>1,5</td></tr>
+        <tr><td>11:00 - 12:00</td><td><b>2,5</b></td></tr>
+    </tbody></table>"""
+
+    entries = _parse_hourly_rolling(html, now)
+
+    assert len(entries) == 2
+    assert entries[0][1] == 1.5
+    assert entries[1][1] == 2.5
+
+
 def test_empty_table_returns_empty():
     now = datetime(2026, 2, 27, 10, 0, tzinfo=TZ_STOCKHOLM)
     entries = _parse_hourly_rolling("<table></table>", now)
@@ -22,7 +22,9 @@ for mod in [
     "homeassistant.components.recorder.statistics",
     "homeassistant.config_entries", "homeassistant.const",
     "homeassistant.core", "homeassistant.exceptions",
-    "homeassistant.helpers", "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers", "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.util", "homeassistant.util.json",
 ]:
     sys.modules.setdefault(mod, ha_mock)
 
@@ -52,6 +54,17 @@ def _mock_recorder():
     return recorder
 
 
+def _mock_coordinator(entries, cost_entries):
+    coordinator = MagicMock()
+    coordinator.historical_entries = entries
+    coordinator.historical_cost_entries = cost_entries
+    coordinator._last_energy_start = None
+    coordinator._last_energy_sum = 0.0
+    coordinator._last_cost_start = None
+    coordinator._last_cost_sum = 0.0
+    return coordinator
+
+
 def _dt(hour: int) -> datetime:
     return datetime(2024, 1, 1, hour, tzinfo=timezone.utc)
 
@@ -114,9 +127,7 @@ def test_get_last_stat_converts_float_timestamp():
 
 def test_import_statistics_first_run():
     hass = MagicMock()
-    coordinator = MagicMock()
-    coordinator.historical_entries = [(_dt(0), 1.0), (_dt(1), 2.0)]
-    coordinator.historical_cost_entries = [(_dt(0), 1.0, 0.5)]
+    coordinator = _mock_coordinator([(_dt(0), 1.0), (_dt(1), 2.0)], [(_dt(0), 1.0, 0.5)])
 
     with patch("custom_components.ecoguard.__init__.get_recorder", return_value=_mock_recorder()), \
          patch("custom_components.ecoguard.__init__.get_last_statistics", return_value={}), \
@@ -130,9 +141,7 @@ def test_import_statistics_first_run():
 
 def test_import_statistics_incremental():
     hass = MagicMock()
-    coordinator = MagicMock()
-    coordinator.historical_entries = [(_dt(0), 1.0), (_dt(1), 2.0), (_dt(2), 3.0)]
-    coordinator.historical_cost_entries = []
+    coordinator = _mock_coordinator([(_dt(0), 1.0), (_dt(1), 2.0), (_dt(2), 3.0)], [])
 
     energy_id = "ecoguard:energy_consumption"
     last_stats = {energy_id: [{"start": _dt(1), "sum": 10.0}]}
@@ -151,9 +160,7 @@ def test_import_statistics_incremental():
 
 def test_import_statistics_incremental_with_float_timestamp():
     hass = MagicMock()
-    coordinator = MagicMock()
-    coordinator.historical_entries = [(_dt(0), 1.0), (_dt(1), 2.0), (_dt(2), 3.0)]
-    coordinator.historical_cost_entries = []
+    coordinator = _mock_coordinator([(_dt(0), 1.0), (_dt(1), 2.0), (_dt(2), 3.0)], [])
 
     energy_id = "ecoguard:energy_consumption"
     last_stats = {energy_id: [{"start": _dt(1).timestamp(), "sum": 10.0}]}
@@ -171,9 +178,7 @@ def test_import_statistics_incremental_with_float_timestamp():
 
 def test_import_statistics_no_new_entries():
     hass = MagicMock()
-    coordinator = MagicMock()
-    coordinator.historical_entries = [(_dt(0), 1.0), (_dt(1), 2.0)]
-    coordinator.historical_cost_entries = []
+    coordinator = _mock_coordinator([(_dt(0), 1.0), (_dt(1), 2.0)], [])
 
     energy_id = "ecoguard:energy_consumption"
     last_stats = {energy_id: [{"start": _dt(1), "sum": 10.0}]}
@@ -184,3 +189,22 @@ def test_import_statistics_no_new_entries():
         _run(_async_import_statistics(hass, coordinator))
 
     mock_add.assert_not_called()
+
+
+def test_import_statistics_uses_cached_cursor():
+    hass = MagicMock()
+    coordinator = _mock_coordinator([(_dt(0), 1.0), (_dt(1), 2.0), (_dt(2), 3.0)], [])
+    coordinator._last_energy_start = _dt(1)
+    coordinator._last_energy_sum = 10.0
+
+    with patch("custom_components.ecoguard.__init__.get_recorder", return_value=_mock_recorder()), \
+         patch("custom_components.ecoguard.__init__.get_last_statistics") as mock_last, \
+         patch("custom_components.ecoguard.__init__.async_add_external_statistics") as mock_add:
+        _run(_async_import_statistics(hass, coordinator))
+
+    mock_last.assert_not_called()
+    assert mock_add.call_count == 1
+    energy_stats = mock_add.call_args_list[0][0][2]
+    assert [s.sum for s in energy_stats] == [13.0]
+    assert coordinator._last_energy_start == _dt(2)
+    assert coordinator._last_energy_sum == 13.0